@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Any
@@ -21,12 +22,31 @@ STATE_DIR = ROOT_DIR / ".state"
 STATE_DIR.mkdir(exist_ok=True)
 
 HUMBLE_COOKIE_FILE = STATE_DIR / "humble.cookies"
+HUMBLE_UA_FILE = STATE_DIR / "humble.ua"
 STEAM_COOKIE_FILE = STATE_DIR / "steam.cookies"
+ORDER_CACHE = STATE_DIR / "orders.json"
+CHOICE_CACHE_DIR = STATE_DIR / "choice_data"
+APP_NAMES_CACHE = STATE_DIR / "appnames.json"
 CONFIG_FILE = ROOT_DIR / "config.yaml"
 
 
+_CONFIG: dict[str, Any] | None = None
+
+# "key: value" lines for the PyYAML-less fallback parser (comments never match);
+# only [ \t] around the colon, so an empty value can't swallow the next line
+_CONFIG_LINE_RE = re.compile(r"^[ \t]*([^:#\s]+)[ \t]*:[ \t]*(.*?)[ \t]*$", re.M)
+
+
 def load_config() -> dict[str, Any]:
-    """Load config.yaml. Returns empty dict if missing."""
+    """Load config.yaml (parsed once, then cached). Returns empty dict if missing."""
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = _read_config()
+    return dict(_CONFIG)
+
+
+def _read_config() -> dict[str, Any]:
+    """Parse config.yaml from disk. Returns empty dict if missing."""
     if not CONFIG_FILE.exists():
         return {}
     try:
@@ -34,26 +54,33 @@ def load_config() -> dict[str, Any]:
     except ImportError:
         # Fall back to basic parsing if PyYAML not installed
         config: dict[str, Any] = {}
-        with open(CONFIG_FILE, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if ":" in line:
-                    key, _, val = line.partition(":")
-                    val = val.strip()
-                    if val.lower() in ("true", "false"):
-                        val = val.lower() == "true"
-                    elif val.isdigit():
-                        val = int(val)
-                    config[key.strip()] = val
+        for key, val in _CONFIG_LINE_RE.findall(CONFIG_FILE.read_text()):
+            if val.lower() in ("true", "false"):
+                val = val.lower() == "true"
+            elif val.isdigit():
+                val = int(val)
+            config[key] = val
         return config
     with open(CONFIG_FILE, "r") as f:
         return yaml.safe_load(f) or {}
 
 
+def _parse_concurrency(value: Any, default: int = 8) -> int:
+    """Coerce the http_concurrency setting to an int >= 1 (*default* if unparseable)."""
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
+# Max in-flight requests against Humble; high values trip its rate limiting
+HTTP_CONCURRENCY = _parse_concurrency(load_config().get("http_concurrency", 8))
+
+
 def save_config(config: dict[str, Any]) -> None:
     """Write config dict to config.yaml."""
+    global _CONFIG
+    _CONFIG = dict(config)
     try:
         import yaml
         with open(CONFIG_FILE, "w") as f:
@@ -3,22 +3,31 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import os
 import sys
 from concurrent.futures import as_completed
 
 import cloudscraper
-from requests_futures.sessions import FuturesSession
 
 from src.chooser import humble_chooser_mode
 from src.export import export_mode
-from src.humble_api import HUMBLE_ORDER_DETAILS_API, HUMBLE_ORDERS_API
+from src.humble_api import (
+    HUMBLE_ORDER_DETAILS_API,
+    HUMBLE_ORDERS_API,
+    humble_retriever,
+    load_order_cache,
+    save_order_cache,
+)
 from src.redeemer import redeem_steam_keys
 from src.utils import (
     console,
     find_dict_keys,
+    loads_json,
     print_info,
     print_rule,
     print_success,
+    print_warning,
     prompt_menu,
 )
 
@@ -60,7 +69,8 @@ def main(argv: list[str] | None = None) -> None:
     args = _parse_args(argv)
 
     # Redirect stderr to error.log
-    sys.stderr = open("error.log", "a")
+    sys.stderr = open("error.log", "a", buffering=1, encoding="utf-8")
+    atexit.register(sys.stderr.close)
 
     # Create a consistent session for Humble API use
     humble_session = cloudscraper.CloudScraper()
@@ -69,20 +79,30 @@ def main(argv: list[str] | None = None) -> None:
 
     orders = humble_session.get(HUMBLE_ORDERS_API).json()
 
-    order_details: list[dict] = []
+    # Finalized orders never change, so only fetch the ones not cached yet
+    cached_orders = load_order_cache()
+    order_details: list[dict] = [
+        cached_orders[order["gamekey"]]
+        for order in orders
+        if order["gamekey"] in cached_orders
+    ]
+    pending_orders = [order for order in orders if order["gamekey"] not in cached_orders]
+
     with console.status(
-        f"Fetching [bold]{len(orders)}[/bold] order details…", spinner="dots"
+        f"Fetching [bold]{len(pending_orders)}[/bold] order details…", spinner="dots"
     ):
-        with FuturesSession(session=humble_session, max_workers=30) as retriever:
-            order_futures = [
-                retriever.get(
-                    f"{HUMBLE_ORDER_DETAILS_API}{order['gamekey']}?all_tpkds=true"
-                )
-                for order in orders
-            ]
-            for future in as_completed(order_futures):
-                resp = future.result()
-                order_details.append(resp.json())
+        retriever = humble_retriever(humble_session)
+        order_futures = [
+            retriever.get(
+                f"{HUMBLE_ORDER_DETAILS_API}{order['gamekey']}?all_tpkds=true"
+            )
+            for order in pending_orders
+        ]
+        for future in as_completed(order_futures):
+            resp = future.result()
+            order_details.append(loads_json(resp.content))
+
+    save_order_cache(order_details)
 
     print_success(f"Fetched {len(order_details)} orders from Humble.")
 
@@ -100,17 +120,22 @@ def main(argv: list[str] | None = None) -> None:
 
     filters = ["errored.csv", "already_owned.csv", "redeemed.csv"]
     original_length = len(steam_keys)
+    seen_steam_keys: set[str] = set()
     for filter_file in filters:
+        if not os.path.isfile(filter_file):
+            continue
         try:
             with open(filter_file, "r", encoding="utf-8-sig") as f:
-                rows = [line.strip().split(",") for line in f if line.strip()]
-            seen_steam_keys = {row[2] for row in rows if len(row) >= 3 and row[2]}
-            steam_keys = [
-                key for key in steam_keys
-                if key.get("redeemed_key_val", "") not in seen_steam_keys
-            ]
-        except Exception:
-            pass
+                for line in f:
+                    row = line.strip().split(",")
+                    if len(row) >= 3 and row[2]:
+                        seen_steam_keys.add(row[2])
+        except OSError as e:
+            print_warning(f"Could not read {filter_file}: {e}")
+    steam_keys = [
+        key for key in steam_keys
+        if key.get("redeemed_key_val", "") not in seen_steam_keys
+    ]
     if len(steam_keys) != original_length:
         print_info(
             f"Filtered {original_length - len(steam_keys)} keys from previous runs"
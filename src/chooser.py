@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import time
 import webbrowser
 from typing import Any
 
@@ -60,6 +59,40 @@ def choose_games(
                 print_success(f"Chose game {escape(choice['title'])}")
 
 
+def _choices_table(choices: list[dict[str, Any]]) -> Table:
+    """Build the numbered game listing table for a Choice month."""
+    table = Table(
+        show_header=True,
+        header_style="bold cyan",
+        border_style="bright_blue",
+        box=box.ROUNDED,
+        padding=(0, 1),
+    )
+    table.add_column("#", style="cyan", justify="right", width=4)
+    table.add_column("Title", style="bold")
+    table.add_column("Rating", style="green")
+    table.add_column("Notes", style="yellow")
+
+    for idx, choice in enumerate(choices):
+        title = escape(choice["title"])
+        rating_text = ""
+        if (
+            "review_text" in choice.get("user_rating", {})
+            and "steam_percent|decimal" in choice.get("user_rating", {})
+        ):
+            rating = choice["user_rating"]["review_text"].replace("_", " ")
+            percentage = (
+                str(int(choice["user_rating"]["steam_percent|decimal"] * 100)) + "%"
+            )
+            rating_text = f"{rating} ({percentage})"
+        note = ""
+        if "tpkds" not in choice:
+            note = "Must redeem via Humble"
+        table.add_row(str(idx + 1), title, rating_text, note)
+
+    return table
+
+
 def humble_chooser_mode(
     humble_session, order_details: list[dict[str, Any]]
 ) -> None:
@@ -77,49 +110,22 @@ def humble_chooser_mode(
             )
             first = False
 
+        remaining = month["choices_remaining"]
+        choices = month["available_choices"]
+        month_name = escape(month["product"]["human_name"])
+        table = _choices_table(choices)
+
+        # Only clear and redraw the listing when the screen actually changed;
+        # input errors are printed under the existing prompt instead
+        redraw = True
         ready = False
         while not ready:
-            cls()
-            remaining = month["choices_remaining"]
-            choices = month["available_choices"]
-
-            month_name = escape(month["product"]["human_name"])
-            print_rule(
-                f"{month_name}  ·  [cyan]{remaining}[/cyan] choices remaining"
-            )
-
-            # Build game listing table
-            table = Table(
-                show_header=True,
-                header_style="bold cyan",
-                border_style="bright_blue",
-                box=box.ROUNDED,
-                padding=(0, 1),
-            )
-            table.add_column("#", style="cyan", justify="right", width=4)
-            table.add_column("Title", style="bold")
-            table.add_column("Rating", style="green")
-            table.add_column("Notes", style="yellow")
-
-            for idx, choice in enumerate(choices):
-                title = escape(choice["title"])
-                rating_text = ""
-                if (
-                    "review_text" in choice.get("user_rating", {})
-                    and "steam_percent|decimal" in choice.get("user_rating", {})
-                ):
-                    rating = choice["user_rating"]["review_text"].replace("_", " ")
-                    percentage = (
-                        str(int(choice["user_rating"]["steam_percent|decimal"] * 100))
-                        + "%"
-                    )
-                    rating_text = f"{rating} ({percentage})"
-                note = ""
-                if "tpkds" not in choice:
-                    note = "Must redeem via Humble"
-                table.add_row(str(idx + 1), title, rating_text, note)
-
-            console.print(table)
+            if redraw:
+                cls()
+                print_rule(
+                    f"{month_name}  ·  [cyan]{remaining}[/cyan] choices remaining"
+                )
+                console.print(table)
 
             if redeem_all is None and remaining == len(choices):
                 redeem_all = prompt_yes_no("Redeem all?")
@@ -129,23 +135,24 @@ def humble_chooser_mode(
             if redeem_all:
                 user_input = [str(i + 1) for i in range(len(choices))]
             else:
-                if redeem_keys:
-                    auto_note = " [dim](webpage keys auto-redeemed after)[/dim]"
-                else:
-                    auto_note = ""
+                if redraw:
+                    if redeem_keys:
+                        auto_note = " [dim](webpage keys auto-redeemed after)[/dim]"
+                    else:
+                        auto_note = ""
 
-                console.print()
-                console.print(
-                    f"Indexes separated by commas "
-                    f"(e.g. [bold]1[/bold] or [bold]1,2,3[/bold])"
-                )
-                console.print(
-                    f"Type [bold]link[/bold] to open in browser{auto_note}"
-                )
-                console.print(
-                    "Press [bold]Enter[/bold] to skip this month"
-                )
-                console.print()
+                    console.print()
+                    console.print(
+                        f"Indexes separated by commas "
+                        f"(e.g. [bold]1[/bold] or [bold]1,2,3[/bold])"
+                    )
+                    console.print(
+                        f"Type [bold]link[/bold] to open in browser{auto_note}"
+                    )
+                    console.print(
+                        "Press [bold]Enter[/bold] to skip this month"
+                    )
+                    console.print()
 
                 raw = Prompt.ask("[bold cyan]Selection[/bold cyan]", default="")
                 user_input = [
@@ -153,6 +160,7 @@ def humble_chooser_mode(
                     for uinput in raw.split(",")
                     if uinput.strip()
                 ]
+            redraw = False
 
             if len(user_input) == 0:
                 ready = True
@@ -161,18 +169,17 @@ def humble_chooser_mode(
                 if redeem_keys:
                     try_redeem_keys.append(month["gamekey"])
             else:
-                invalid_option = lambda option: (
-                    not option.isnumeric()
-                    or option == "0"
-                    or int(option) > len(choices)
-                )
-                invalid = [opt for opt in user_input if invalid_option(opt)]
+                valid_range = range(1, len(choices) + 1)
+                invalid = [
+                    opt
+                    for opt in user_input
+                    if not opt.isdecimal() or int(opt) not in valid_range
+                ]
 
                 if invalid:
                     print_error("Invalid options: " + ", ".join(invalid))
-                    time.sleep(2)
                 else:
-                    user_input_set = set(int(opt) for opt in user_input)
+                    user_input_set = {int(opt) for opt in user_input}
                     chosen = [
                         choice
                         for idx, choice in enumerate(choices)
@@ -183,7 +190,6 @@ def humble_chooser_mode(
                         print_warning(
                             f"Too many — only {remaining} choices left"
                         )
-                        time.sleep(2)
                     else:
                         console.print()
                         console.print("[bold]Selected:[/bold]")
@@ -202,6 +208,8 @@ def humble_chooser_mode(
                             if redeem_keys:
                                 try_redeem_keys.append(month["gamekey"])
                             ready = True
+                        else:
+                            redraw = True
 
     if first:
         print_info("No Humble Choices need choosing — you're all up-to-date!")
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import csv
 import sys
 import time
+from itertools import repeat
 from typing import Any
 
-from src.humble_api import redeem_humble_key
-from src.ownership import get_owned_apps, match_ownership
+from src.humble_api import reveal_humble_keys
+from src.ownership import OwnedAppIndex, get_owned_apps, match_ownership
 from src.steam_auth import steam_login
 from src.utils import (
     cls,
@@ -65,44 +67,42 @@ def export_mode(humble_session, order_details: list[dict[str, Any]]) -> None:
     )
 
     if steam_config:
-        steam_session = steam_login()
+        steam_session = steam_login(base_session=humble_session)
         if verify_logins_session(steam_session)[1]:
             owned_app_details = get_owned_apps(steam_session)
+            owned_index = OwnedAppIndex(owned_app_details)
 
     desired_keys = "steam_app_id" if export_steam_only else "key_type_human_name"
-    keylist = list(find_dict_keys(order_details, desired_keys, True))
-
-    keys: list[dict] = []
-    for tpk in keylist:
-        revealed = "redeemed_key_val" in tpk
-        export = (export_revealed and revealed) or (export_unrevealed and not revealed)
-
-        if export:
-            if export_unrevealed and confirm_reveal:
-                tpk["redeemed_key_val"] = redeem_humble_key(humble_session, tpk)
+    keys = [
+        tpk
+        for tpk in find_dict_keys(order_details, desired_keys, True)
+        if (export_revealed and "redeemed_key_val" in tpk)
+        or (export_unrevealed and "redeemed_key_val" not in tpk)
+    ]
+
+    if export_unrevealed and confirm_reveal:
+        to_reveal = [tpk for tpk in keys if "redeemed_key_val" not in tpk]
+        with console.status(
+            f"Revealing [bold]{len(to_reveal)}[/bold] keys…", spinner="dots"
+        ):
+            reveal_humble_keys(humble_session, to_reveal)
 
+    ts = time.strftime("%Y%m%d-%H%M%S")
+    filename = f"humble_export_{ts}.csv"
+    with open(filename, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_KEY_HEADERS)
+        for tpk in keys:
             if owned_app_details is not None and "steam_app_id" in tpk:
                 owned = tpk["steam_app_id"] in owned_app_details
                 if not owned:
-                    best_match = match_ownership(owned_app_details, tpk)
+                    best_match = match_ownership(owned_index, tpk)
                     owned = (
                         best_match[1] is not None and best_match[1] in owned_app_details
                     )
                 tpk["steam_ownership"] = owned
 
-            keys.append(tpk)
-
-    ts = time.strftime("%Y%m%d-%H%M%S")
-    filename = f"humble_export_{ts}.csv"
-    with open(filename, "w", encoding="utf-8-sig") as f:
-        f.write(",".join(EXPORT_KEY_HEADERS) + "\n")
-        for key in keys:
-            row = []
-            for col in EXPORT_KEY_HEADERS:
-                if col in key:
-                    row.append(f'"{key[col]}"')
-                else:
-                    row.append("")
-            f.write(",".join(row) + "\n")
+            # map() calls tpk.get(col, "") per column without a Python-level loop
+            writer.writerow(map(tpk.get, EXPORT_KEY_HEADERS, repeat("")))
 
     print_success(f"Exported to {filename}")
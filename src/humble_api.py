@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
-import json
 import sys
+from concurrent.futures import as_completed
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from pathlib import Path
 from typing import Any, Generator
 
+from requests_futures.sessions import FuturesSession
 from rich.prompt import Prompt
 
-from src import HUMBLE_COOKIE_FILE
+from src import (
+    CHOICE_CACHE_DIR,
+    HTTP_CONCURRENCY,
+    HUMBLE_COOKIE_FILE,
+    HUMBLE_UA_FILE,
+    ORDER_CACHE,
+)
 from src.utils import (
     cls,
     console,
     export_cookies,
     find_dict_keys,
+    load_json_cache,
+    loads_json,
     print_error,
     print_rule,
+    save_json_cache,
     try_recover_cookies,
     verify_logins_session,
 )
@@ -43,10 +56,36 @@ HUMBLE_HEADERS: dict[str, str] = {
 }
 
 
+_retriever: FuturesSession | None = None
+
+
+def humble_retriever(humble_session) -> FuturesSession:
+    """Return the shared FuturesSession wrapping *humble_session*.
+
+    One thread pool is reused for every concurrent Humble fetch so the
+    cloudscraper connection pool and cookies carry across modes.
+    """
+    global _retriever
+    if _retriever is None or _retriever.session is not humble_session:
+        _retriever = FuturesSession(
+            session=humble_session, max_workers=HTTP_CONCURRENCY
+        )
+    return _retriever
+
+
 def humble_login(session, *, auto: bool = False) -> bool:
     """Log into Humble Bundle. Updates *session* in place. Returns True on success."""
     cls()
 
+    # Cloudflare clearance cookies are tied to the User-Agent they were issued
+    # to, and cloudscraper picks a random one per instance — restore ours
+    try:
+        saved_ua = HUMBLE_UA_FILE.read_text(encoding="utf-8").strip()
+    except OSError:
+        saved_ua = ""
+    if saved_ua:
+        session.headers["User-Agent"] = saved_ua
+
     # Attempt to use saved session
     if (
         try_recover_cookies(HUMBLE_COOKIE_FILE, session)
@@ -128,18 +167,24 @@ def humble_login(session, *, auto: bool = False) -> bool:
                 break
 
         export_cookies(HUMBLE_COOKIE_FILE, session)
+        try:
+            HUMBLE_UA_FILE.write_text(session.headers["User-Agent"], encoding="utf-8")
+        except OSError:
+            pass
         return True
 
 
-def redeem_humble_key(session, tpk: dict[str, Any]) -> str:
-    """Reveal a key on Humble's API for the given *tpk* entry. Returns the key string."""
-    payload = {
+def _redeem_payload(tpk: dict[str, Any]) -> dict[str, Any]:
+    """Form data for revealing *tpk* on Humble."""
+    return {
         "keytype": tpk["machine_name"],
         "key": tpk["gamekey"],
         "keyindex": tpk["keyindex"],
     }
-    resp = session.post(HUMBLE_REDEEM_API, data=payload, headers=HUMBLE_HEADERS)
 
+
+def _parse_redeem_response(resp, tpk: dict[str, Any]) -> str:
+    """Extract the revealed key from a redeemkey *resp*. Returns "" on failure."""
     resp_json = resp.json()
     if resp.status_code != 200 or "error_msg" in resp_json or not resp_json["success"]:
         print_error(f"Error redeeming key on Humble for {tpk['human_name']}")
@@ -152,54 +197,162 @@ def redeem_humble_key(session, tpk: dict[str, Any]) -> str:
         return resp.text
 
 
-def get_month_data(humble_session, month: dict) -> dict:
-    """Fetch Humble Choice month data from the subscription page."""
-    r = humble_session.get(HUMBLE_SUB_PAGE + month["product"]["choice_url"])
+def redeem_humble_key(session, tpk: dict[str, Any]) -> str:
+    """Reveal a key on Humble's API for the given *tpk* entry. Returns the key string."""
+    resp = session.post(
+        HUMBLE_REDEEM_API, data=_redeem_payload(tpk), headers=HUMBLE_HEADERS
+    )
+    return _parse_redeem_response(resp, tpk)
+
+
+def reveal_humble_keys(humble_session, tpks: list[dict[str, Any]]) -> None:
+    """Reveal every entry in *tpks* concurrently, storing each in ``redeemed_key_val``."""
+    retriever = humble_retriever(humble_session)
+    reveal_futures = {
+        retriever.post(
+            HUMBLE_REDEEM_API, data=_redeem_payload(tpk), headers=HUMBLE_HEADERS
+        ): tpk
+        for tpk in tpks
+    }
+    for future in as_completed(reveal_futures):
+        tpk = reveal_futures[future]
+        tpk["redeemed_key_val"] = _parse_redeem_response(future.result(), tpk)
+
+
+# Humble still adds games to recent orders (bundle extensions, tier upgrades),
+# so only orders at least this old are treated as settled
+ORDER_CACHE_MIN_AGE = timedelta(days=60)
+
+
+def _order_settled(order: dict) -> bool:
+    """True if *order* was created more than ``ORDER_CACHE_MIN_AGE`` ago."""
+    try:
+        created = datetime.fromisoformat(order["created"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - created > ORDER_CACHE_MIN_AGE
+
+
+def _order_finalized(order: dict) -> bool:
+    """True if *order* can no longer change: old enough, no pending choices, every key revealed."""
+    if not _order_settled(order) or order.get("choices_remaining", 0) > 0:
+        return False
+    return all(
+        "redeemed_key_val" in tpk
+        for tpk in find_dict_keys(order, "key_type_human_name", True)
+    )
+
 
-    data_indicator = '<script id="webpack-monthly-product-data" type="application/json">'
-    json_text = r.text.split(data_indicator)[1].split("</script>")[0].strip()
-    return json.loads(json_text)["contentChoiceOptions"]
+def load_order_cache() -> dict[str, dict]:
+    """Load cached order details keyed by gamekey. Returns empty dict if unusable."""
+    cached = load_json_cache(ORDER_CACHE) or {}
+    # Entries written before the age cutoff existed may still be too recent
+    return {gamekey: order for gamekey, order in cached.items() if _order_settled(order)}
+
+
+def save_order_cache(order_details: list[dict]) -> None:
+    """Atomically persist finalized orders from *order_details* to the cache."""
+    save_json_cache(
+        ORDER_CACHE,
+        {order["gamekey"]: order for order in order_details if _order_finalized(order)},
+    )
+
+
+# Choice menus are near-static once published; refetch at most daily
+CHOICE_CACHE_TTL = 24 * 60 * 60
+
+
+def _choice_cache_path(gamekey: str) -> Path:
+    return CHOICE_CACHE_DIR / f"{gamekey}.json"
+
+
+_MONTH_DATA_MARKER = b'<script id="webpack-monthly-product-data" type="application/json">'
+
+
+def _parse_month_data(html: bytes) -> dict:
+    """Extract the ``contentChoiceOptions`` blob from a raw subscription page."""
+    start = html.index(_MONTH_DATA_MARKER) + len(_MONTH_DATA_MARKER)
+    end = html.index(b"</script>", start)
+    return loads_json(html[start:end].strip())["contentChoiceOptions"]
+
+
+def _cached_month_data(month: dict, response=None) -> dict | None:
+    """Choice data for *month*, through the daily cache.
+
+    With *response* (the fetched subscription page), parse it and refresh the
+    cache. Without, return the cached copy — None if missing or stale.
+    """
+    cache_path = _choice_cache_path(month["gamekey"])
+    if response is None:
+        return load_json_cache(cache_path, max_age=CHOICE_CACHE_TTL)
+    data = _parse_month_data(response.content)
+    save_json_cache(cache_path, data)
+    return data
 
 
 def get_choices(
     humble_session, order_details: list[dict]
 ) -> Generator[dict, None, None]:
-    """Yield Humble Choice months that still have unchosen games."""
+    """Yield Humble Choice months that still have unchosen games.
+
+    Month pages are fetched concurrently up front; months are still yielded
+    oldest-first as their page arrives.
+    """
     months = [
         month
         for month in order_details
         if "is_humble_choice" in month["product"]
         and month["product"]["is_humble_choice"]
+        and month["choices_remaining"] > 0
     ]
 
-    months = sorted(months, key=lambda m: m["created"])
+    months = sorted(months, key=itemgetter("created"))
 
-    for month in months:
-        if month["choices_remaining"] > 0:
-            chosen_games = set(find_dict_keys(month["tpkd_dict"], "machine_name"))
-
-            month["choice_data"] = get_month_data(humble_session, month)
+    choice_data = {month["gamekey"]: _cached_month_data(month) for month in months}
 
-            identifier = (
-                "initial"
-                if "initial" in month["choice_data"]["contentChoiceData"]
-                else "initial-classic"
-            )
-
-            if identifier not in month["choice_data"]["contentChoiceData"]:
-                for key in month["choice_data"]["contentChoiceData"]:
-                    if "content_choices" in month["choice_data"]["contentChoiceData"][key]:
-                        identifier = key
+    retriever = humble_retriever(humble_session)
+    month_futures = {
+        month["gamekey"]: retriever.get(HUMBLE_SUB_PAGE + month["product"]["choice_url"])
+        for month in months
+        if choice_data[month["gamekey"]] is None
+    }
 
-            choice_options = month["choice_data"]["contentChoiceData"][identifier][
-                "content_choices"
-            ]
+    for month in months:
+        chosen_games = set(find_dict_keys(month["tpkd_dict"], "machine_name"))
 
-            month["available_choices"] = [
-                game[1]
-                for game in choice_options.items()
-                if set(find_dict_keys(game[1], "machine_name")).isdisjoint(chosen_games)
-            ]
+        gamekey = month["gamekey"]
+        if gamekey in month_futures:
+            choice_data[gamekey] = _cached_month_data(
+                month, month_futures[gamekey].result()
+            )
+        month["choice_data"] = choice_data[gamekey]
+
+        identifier = (
+            "initial"
+            if "initial" in month["choice_data"]["contentChoiceData"]
+            else "initial-classic"
+        )
+
+        if identifier not in month["choice_data"]["contentChoiceData"]:
+            for key in month["choice_data"]["contentChoiceData"]:
+                if "content_choices" in month["choice_data"]["contentChoiceData"][key]:
+                    identifier = key
+
+        choice_options = month["choice_data"]["contentChoiceData"][identifier][
+            "content_choices"
+        ]
+
+        # any() stops walking a game's subtree at the first already-chosen key
+        month["available_choices"] = [
+            game
+            for game in choice_options.values()
+            if not any(
+                machine_name in chosen_games
+                for machine_name in find_dict_keys(game, "machine_name")
+            )
+        ]
 
-            month["parent_identifier"] = identifier
-            yield month
+        month["parent_identifier"] = identifier
+        yield month
@@ -3,16 +3,31 @@
 from __future__ import annotations
 
 import os
+import re
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
-from fuzzywuzzy import fuzz
-
+from requests.adapters import HTTPAdapter
+from rapidfuzz import fuzz, process, utils
 from rich.prompt import Prompt
 
-from src import load_config, save_config
+from src import APP_NAMES_CACHE, load_config, save_config
 from src.steam_auth import STEAM_USERDATA_API
-from src.utils import console, print_error, print_info, print_success, print_warning
+from src.utils import (
+    console,
+    load_json_cache,
+    loads_json,
+    print_error,
+    print_info,
+    print_success,
+    print_warning,
+    save_json_cache,
+)
+
+# The Steam catalog changes slowly; refetch it at most daily
+APP_LIST_TTL = 24 * 60 * 60
 
 
 def load_steam_api_key() -> str | None:
@@ -25,41 +40,126 @@ def load_steam_api_key() -> str | None:
     return key or None
 
 
-def fetch_app_list(api_key: str) -> list[dict[str, Any]]:
-    """Fetch full Steam app list using IStoreService/GetAppList (requires API key)."""
-    all_apps: list[dict[str, Any]] = []
-    last_appid = 0
+STEAM_APP_LIST_API = "https://api.steampowered.com/IStoreService/GetAppList/v1/"
+
+# Steam starts returning 500s under heavier parallel load, so stay small
+_APP_LIST_WORKERS = 3
+
+# Keep-alive session for Steam Web API calls, sized for the worker pool
+_steam_api = requests.Session()
+_steam_api.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=_APP_LIST_WORKERS + 1,
+        pool_maxsize=_APP_LIST_WORKERS + 1,
+    ),
+)
+
+
+def _fetch_app_page(api_key: str, last_appid: int) -> dict[str, Any]:
+    """Fetch one GetAppList page of apps with appid > *last_appid*."""
+    params: dict[str, str] = {
+        "key": api_key,
+        "include_games": "true",
+        "include_dlc": "true",
+        "include_software": "true",
+        "max_results": "50000",
+    }
+    if last_appid:
+        params["last_appid"] = str(last_appid)
+    resp = _steam_api.get(STEAM_APP_LIST_API, params=params, timeout=30)
+    if resp.status_code != 200:
+        raise Exception(f"IStoreService/GetAppList returned {resp.status_code}")
+    return loads_json(resp.content).get("response", {})
+
+
+def _fetch_app_window(
+    api_key: str, start: int, end: int | None = None
+) -> tuple[list[dict[str, Any]], bool]:
+    """Page through apps with ``start < appid <= end`` (no upper bound if *end* is None).
+
+    Returns ``(apps, exhausted)`` where *exhausted* means the catalog ended
+    inside this window.
+    """
+    apps: list[dict[str, Any]] = []
+    last_appid = start
     while True:
-        params: dict[str, str] = {
-            "key": api_key,
-            "include_games": "true",
-            "include_dlc": "true",
-            "include_software": "true",
-            "max_results": "50000",
-        }
-        if last_appid:
-            params["last_appid"] = str(last_appid)
-        resp = requests.get(
-            "https://api.steampowered.com/IStoreService/GetAppList/v1/",
-            params=params,
-            timeout=30,
-        )
-        if resp.status_code != 200:
-            raise Exception(f"IStoreService/GetAppList returned {resp.status_code}")
-        data = resp.json().get("response", {})
-        apps = data.get("apps", [])
-        all_apps.extend(apps)
-        if not data.get("have_more_results", False):
-            break
+        data = _fetch_app_page(api_key, last_appid)
+        page = data.get("apps", [])
         last_appid = data.get("last_appid", 0)
-        if not last_appid:
-            break
-    return all_apps
+        if not data.get("have_more_results", False) or not last_appid:
+            # Last page of the catalog — keep all of it, even past *end*,
+            # since the windows after this one are cancelled
+            apps.extend(page)
+            return apps, True
+        if end is None:
+            apps.extend(page)
+        else:
+            apps.extend(app for app in page if app["appid"] <= end)
+        if end is not None and last_appid >= end:
+            return apps, False
+
+
+def fetch_app_list(api_key: str) -> list[dict[str, Any]]:
+    """Fetch full Steam app list using IStoreService/GetAppList (requires API key).
+
+    The first page tells us roughly how many appids one page spans; the rest
+    of the catalog is then fetched as appid windows of that size, a few at a
+    time. Any failure drops back to sequential paging from the last complete
+    window.
+    """
+    first = _fetch_app_page(api_key, 0)
+    all_apps: list[dict[str, Any]] = list(first.get("apps", []))
+    span = first.get("last_appid", 0)
+    if not first.get("have_more_results", False) or not span:
+        return all_apps
+
+    covered = span
+    try:
+        with ThreadPoolExecutor(max_workers=_APP_LIST_WORKERS) as pool:
+            pending = deque(
+                pool.submit(_fetch_app_window, api_key, span * k, span * (k + 1))
+                for k in range(1, _APP_LIST_WORKERS + 1)
+            )
+            next_window = _APP_LIST_WORKERS + 1
+            while pending:
+                apps, exhausted = pending.popleft().result()
+                all_apps.extend(apps)
+                covered += span
+                if exhausted:
+                    for future in pending:
+                        future.cancel()
+                    return all_apps
+                pending.append(
+                    pool.submit(
+                        _fetch_app_window,
+                        api_key,
+                        span * next_window,
+                        span * (next_window + 1),
+                    )
+                )
+                next_window += 1
+    except Exception:
+        pass
+
+    # Parallel paging failed (likely a 429/500) — finish sequentially
+    return all_apps + _fetch_app_window(api_key, covered)[0]
+
+
+def load_app_names(api_key: str) -> dict[int, str]:
+    """Return Steam's {appid: name} index, from the daily disk cache when it's fresh."""
+    # Cached as [appid, name] pairs: half the size of the raw app list, and
+    # dict() over pairs is the cheapest way back to int keys
+    pairs = load_json_cache(APP_NAMES_CACHE, max_age=APP_LIST_TTL)
+    if pairs is None:
+        pairs = [(app["appid"], app["name"]) for app in fetch_app_list(api_key)]
+        save_json_cache(APP_NAMES_CACHE, pairs)
+    return dict(pairs)
 
 
 def get_owned_apps(steam_session, *, auto: bool = False) -> dict[int, str]:
     """Get the user's owned content from Steam. Returns {appid: name} dict."""
-    owned_content = steam_session.get(STEAM_USERDATA_API).json()
+    owned_content = loads_json(steam_session.get(STEAM_USERDATA_API).content)
     owned_app_ids = set(owned_content["rgOwnedPackages"] + owned_content["rgOwnedApps"])
 
     api_key = load_steam_api_key()
@@ -67,8 +167,8 @@ def get_owned_apps(steam_session, *, auto: bool = False) -> dict[int, str]:
     if api_key:
         try:
             with console.status("Fetching Steam app list…", spinner="dots"):
-                app_list = fetch_app_list(api_key)
-            print_success(f"Fetched {len(app_list)} apps")
+                app_names = load_app_names(api_key)
+            print_success(f"Fetched {len(app_names)} apps")
         except Exception as e:
             print_error(f"IStoreService/GetAppList error: {e}")
             print_warning("Could not fetch Steam app list, skipping ownership detection")
@@ -104,33 +204,116 @@ def get_owned_apps(steam_session, *, auto: bool = False) -> dict[int, str]:
         print_info("Saved to [cyan]config.yaml[/cyan] for next time.")
         try:
             with console.status("Fetching Steam app list…", spinner="dots"):
-                app_list = fetch_app_list(api_key)
-            print_success(f"Fetched {len(app_list)} apps")
+                app_names = load_app_names(api_key)
+            print_success(f"Fetched {len(app_names)} apps")
         except Exception as e:
             print_error(f"IStoreService/GetAppList error: {e}")
             print_warning("Could not fetch Steam app list, skipping ownership detection")
             return {}
 
+    # Owned ids number in the thousands at most — look them up rather than
+    # scanning the whole catalog
     return {
-        app["appid"]: app["name"]
-        for app in app_list
-        if app["appid"] in owned_app_ids
+        appid: app_names[appid]
+        for appid in owned_app_ids
+        if appid in app_names
     }
 
 
+# "(TM)"/"(R)" spelled out in ASCII; the ®/™ symbols already vanish in default_process
+_TRADEMARK_RE = re.compile(r"\((?:tm|r)\)", re.IGNORECASE)
+
+
+def _normalize(name: str) -> str:
+    """Lowercase, strip punctuation and trademark marks, collapse whitespace."""
+    return " ".join(utils.default_process(_TRADEMARK_RE.sub(" ", name)).split())
+
+
+def _sort_tokens(name: str) -> str:
+    return " ".join(sorted(name.split()))
+
+
+class OwnedAppIndex:
+    """Owned Steam app names, normalized once for repeated fuzzy matching."""
+
+    def __init__(self, owned_app_details: dict[int, str]) -> None:
+        self.appids = list(owned_app_details)
+        self.names = [_normalize(name) for name in owned_app_details.values()]
+        # token_sort_ratio == ratio over sorted tokens, so pre-sort them once
+        self.sorted_names = [_sort_tokens(name) for name in self.names]
+        self.exact: dict[str, int] = {}
+        for appid, name in zip(self.appids, self.names):
+            # Names that normalize to nothing ("???", "™") must not match blank queries
+            if name:
+                self.exact.setdefault(name, appid)
+        # token -> positions of owned names containing it, to shortlist candidates
+        self.token_index: defaultdict[str, list[int]] = defaultdict(list)
+        for idx, name in enumerate(self.names):
+            for token in set(name.split()):
+                self.token_index[token].append(idx)
+        # Memoized match_ownership results, keyed by normalized query
+        self.matches: dict[str, tuple[int, int | None]] = {}
+
+
 def match_ownership(
-    owned_app_details: dict[int, str], game: dict[str, Any]
+    owned: OwnedAppIndex, game: dict[str, Any]
 ) -> tuple[int, int | None]:
     """Fuzzy-match *game* against owned apps. Returns (score, appid) or (0, None)."""
+    query = _normalize(game["human_name"])
+    # Bundles and Choice months repeat titles; score each distinct name once
+    if query not in owned.matches:
+        owned.matches[query] = _best_match(owned, query)
+    return owned.matches[query]
+
+
+def _best_match(owned: OwnedAppIndex, query: str) -> tuple[int, int | None]:
+    """Score normalized *query* against every owned name."""
     threshold = 85
-    matches = [
-        (fuzz.token_set_ratio(appname, game["human_name"]), appid)
-        for appid, appname in owned_app_details.items()
-    ]
+    # A title with nothing left after normalization can't be matched meaningfully
+    if not query:
+        return (0, None)
+    # Identical names need no fuzzy scoring at all
+    if query in owned.exact:
+        return (100, owned.exact[query])
+
+    # Only owned names sharing at least one token with the query are scored
+    candidates = {
+        idx: owned.names[idx]
+        for token in set(query.split())
+        for idx in owned.token_index.get(token, ())
+    }
+    best_match = _score_candidates(owned, query, candidates, threshold)
+    if best_match[1] is None:
+        # Near-misses can share no whole token ("CityLost" vs "City Lost",
+        # "Space3" vs "Space 3") — rescore against the whole library
+        best_match = _score_candidates(owned, query, owned.names, threshold)
+    return best_match
+
+
+def _score_candidates(
+    owned: OwnedAppIndex,
+    query: str,
+    candidates: dict[int, str] | list[str],
+    threshold: int,
+) -> tuple[int, int | None]:
+    """Token-set filter then token-sort rank *candidates* (owned positions -> names)."""
+    if not candidates:
+        return (0, None)
+
+    # One C-level sweep over the candidates; only close token-set hits survive
+    matches = process.extract(
+        query,
+        candidates,
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=threshold,
+        limit=None,
+    )
+    sorted_query = _sort_tokens(query)
+    # extract() orders by score; walk hits in library order so ties on the
+    # token-sort score resolve the same way on every run
     refined_matches = [
-        (fuzz.token_sort_ratio(owned_app_details[appid], game["human_name"]), appid)
-        for score, appid in matches
-        if score > threshold
+        (round(fuzz.ratio(owned.sorted_names[idx], sorted_query)), owned.appids[idx])
+        for idx in sorted(idx for _, score, idx in matches if score > threshold)
     ]
     if refined_matches:
         best_match = max(refined_matches, key=lambda item: item[0])
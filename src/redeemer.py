@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import json
+import os
 import time
+from collections import deque
 from typing import Any
 
 from rich import box
+from rich.console import Group, RenderableType
 from rich.live import Live
 from rich.markup import escape
 from rich.panel import Panel
 from rich.text import Text
 
+from src import load_config
 from src.humble_api import redeem_humble_key
-from src.ownership import get_owned_apps, match_ownership
+from src.ownership import OwnedAppIndex, get_owned_apps, match_ownership
 from src.steam_auth import STEAM_REDEEM_API, steam_login
 from src.utils import (
     console,
@@ -64,20 +68,43 @@ def redeem_steam_key(session, key: str) -> int:
     return error_code or 53
 
 
+# Output buffer size for the result CSVs; rows are flushed on exit
+_WRITE_BUFFER = 1 << 16
+
+
 class KeyFileManager:
-    """Context manager for CSV output files (redeemed, already_owned, errored)."""
+    """Context manager for CSV output files (redeemed, already_owned, errored).
+
+    Rows are block-buffered until :meth:`flush` or exit. Pass ``durable=True``
+    to flush and fsync after every row instead.
+    """
+
+    FILENAMES = ("redeemed.csv", "already_owned.csv", "errored.csv")
 
-    def __init__(self) -> None:
+    def __init__(self, *, durable: bool = False) -> None:
         self._files: dict[str, Any] = {}
+        self._durable = durable
 
     def __enter__(self) -> KeyFileManager:
+        for filename in self.FILENAMES:
+            self._files[filename] = open(
+                filename, "a", buffering=_WRITE_BUFFER, encoding="utf-8-sig"
+            )
         return self
 
     def __exit__(self, *exc: object) -> None:
         for f in self._files.values():
+            f.flush()
+            if self._durable:
+                os.fsync(f.fileno())
             f.close()
         self._files.clear()
 
+    def flush(self) -> None:
+        """Hand buffered rows to the OS so they survive the process being killed."""
+        for f in self._files.values():
+            f.flush()
+
     def write_key(self, code: int, key: dict[str, Any]) -> None:
         """Append a key result to the appropriate CSV file."""
         if code in (15, 9):
@@ -87,18 +114,21 @@ class KeyFileManager:
         else:
             filename = "redeemed.csv"
 
-        if filename not in self._files:
-            self._files[filename] = open(filename, "a", encoding="utf-8-sig")
-
         human_name = key.get("human_name", "").replace(",", ".")
         gamekey = key.get("gamekey", "")
         redeemed_key_val = key.get("redeemed_key_val", "")
-        self._files[filename].write(f"{gamekey},{human_name},{redeemed_key_val}\n")
-        self._files[filename].flush()
+        f = self._files[filename]
+        f.write(f"{gamekey},{human_name},{redeemed_key_val}\n")
+        if self._durable:
+            f.flush()
+            os.fsync(f.fileno())
 
 
 _MAX_LOG_LINES = 20
 
+# Seconds between countdown refreshes while waiting out a rate limit
+_RATE_LIMIT_TICK = 5
+
 
 class RedeemDisplay:
     """Manages the scrolling log + fixed status panel for the Live display."""
@@ -108,9 +138,15 @@ class RedeemDisplay:
         self.redeemed = 0
         self.owned = 0
         self.errors = 0
-        self._log: list[str] = []
+        self._log: deque[str] = deque(maxlen=_MAX_LOG_LINES)
+        self._log_dirty = False
         self._current = "Starting…"
         self._extra = ""
+        # Renderables are built once and mutated in place; build() only
+        # re-parses markup for the parts that actually changed
+        self._status_key: tuple | None = None
+        self._panel = Panel(Text(), border_style="dim", box=box.ROUNDED, padding=(0, 1))
+        self._group = Group(Text(), self._panel)
 
     @property
     def done(self) -> int:
@@ -118,45 +154,42 @@ class RedeemDisplay:
 
     def log(self, line: str) -> None:
         self._log.append(line)
-        if len(self._log) > _MAX_LOG_LINES:
-            self._log = self._log[-_MAX_LOG_LINES:]
+        self._log_dirty = True
 
     def set_current(self, name: str, extra: str = "") -> None:
         self._current = name
         self._extra = extra
 
-    def build(self) -> Text:
+    def build(self) -> RenderableType:
         """Build the full renderable: scrolling log + status panel."""
-        parts: list[str] = []
-
-        # Log section
-        if self._log:
-            parts.append("\n".join(self._log))
-            parts.append("")
-
-        # Status panel content
-        name_esc = escape(self._current)
-        status_lines = [f"[bold]Game:[/bold] {name_esc}"]
-        if self._extra:
-            status_lines.append(f"  {self._extra}")
-        status_lines.append(
-            f"[green]{self.redeemed} redeemed[/green]  |  "
-            f"[yellow]{self.owned} owned[/yellow]  |  "
-            f"[red]{self.errors} errors[/red]  |  "
-            f"[dim]{self.done}/{self.total}[/dim]"
-        )
-
-        status_panel = Panel(
-            "\n".join(status_lines),
-            border_style="dim",
-            box=box.ROUNDED,
-            padding=(0, 1),
-        )
+        # Log section — only re-parsed when a line was added. build() runs on
+        # Live's refresh thread, so clear the flag *before* reading the deque:
+        # a line logged mid-render then just re-flags it for the next frame
+        if self._log_dirty:
+            self._log_dirty = False
+            self._group.renderables[0] = Text.from_markup("\n".join(self._log) + "\n")
+
+        # Status panel content — tallies are bumped directly by the caller,
+        # so compare against what was last rendered
+        status_key = (self._current, self._extra, self.redeemed, self.owned, self.errors)
+        if status_key != self._status_key:
+            self._status_key = status_key
+            status_lines = [f"[bold]Game:[/bold] {escape(self._current)}"]
+            if self._extra:
+                status_lines.append(f"  {self._extra}")
+            status_lines.append(
+                f"[green]{self.redeemed} redeemed[/green]  |  "
+                f"[yellow]{self.owned} owned[/yellow]  |  "
+                f"[red]{self.errors} errors[/red]  |  "
+                f"[dim]{self.done}/{self.total}[/dim]"
+            )
+            self._panel.renderable = Text.from_markup("\n".join(status_lines))
 
         # Combine log text + panel
-        group = Text.from_markup("\n".join(parts)) if parts else Text()
-        from rich.console import Group as RichGroup
-        return RichGroup(group, status_panel) if parts else status_panel
+        return self._group if self._log else self._panel
+
+    def __rich__(self) -> RenderableType:
+        return self.build()
 
 
 def redeem_steam_keys(
@@ -167,7 +200,7 @@ def redeem_steam_keys(
     reveal_all: bool = False,
 ) -> None:
     """Full auto-redeem pipeline: Steam login, ownership check, redeem with rate-limit handling."""
-    session = steam_login(auto=auto)
+    session = steam_login(auto=auto, base_session=humble_session)
 
     print_success("Successfully signed in on Steam.")
     print_info(
@@ -179,14 +212,22 @@ def redeem_steam_keys(
 
     if have_ownership:
         with console.status("Checking ownership…", spinner="dots"):
-            noted_keys = [
-                key for key in humble_keys if key["steam_app_id"] not in owned_app_details
-            ]
+            owned_index = OwnedAppIndex(owned_app_details)
             skipped_games: dict[str, dict] = {}
             unowned_games: list[dict] = []
 
-            for game in noted_keys:
-                best_match = match_ownership(owned_app_details, game)
+            # Single pass: an owned app id drops the key outright; anything else
+            # still goes through the name match, since Humble's id may point at
+            # a different edition or package than the one in the library —
+            # unless the user opted to trust Humble's ids
+            trust_app_ids = bool(load_config().get("trust_steam_app_ids", False))
+            for game in humble_keys:
+                if game["steam_app_id"] in owned_app_details:
+                    continue
+                if trust_app_ids and game["steam_app_id"] is not None:
+                    unowned_games.append(game)
+                    continue
+                best_match = match_ownership(owned_index, game)
                 if best_match[1] is not None and best_match[1] in owned_app_details:
                     skipped_games[game["human_name"].strip()] = game
                 else:
@@ -247,12 +288,12 @@ def redeem_steam_keys(
 
     print_rule("Key Redemption")
 
-    with Live(display.build(), console=console, refresh_per_second=4) as live:
+    # Live re-renders the display itself; the loop only mutates its state
+    with Live(display, console=console, auto_refresh=True, refresh_per_second=4):
         with KeyFileManager() as kfm:
             for key in unowned_games:
                 name = key["human_name"]
                 display.set_current(name)
-                live.update(display.build())
 
                 # Duplicate check
                 if name in seen or (
@@ -262,7 +303,6 @@ def redeem_steam_keys(
                     kfm.write_key(9, key)
                     display.owned += 1
                     display.log(f"[yellow]⊘[/yellow] {escape(name)} [dim]— duplicate[/dim]")
-                    live.update(display.build())
                     continue
                 else:
                     if key["steam_app_id"] is not None:
@@ -272,7 +312,6 @@ def redeem_steam_keys(
                 # Reveal unrevealed keys on Humble
                 if "redeemed_key_val" not in key:
                     display.set_current(name, "[dim]Revealing key on Humble…[/dim]")
-                    live.update(display.build())
                     redeemed_key = redeem_humble_key(humble_session, key)
                     key["redeemed_key_val"] = redeemed_key
 
@@ -281,32 +320,34 @@ def redeem_steam_keys(
                     kfm.write_key(1, key)
                     display.errors += 1
                     display.log(f"[red]✗[/red] {escape(name)} [dim]— invalid key format[/dim]")
-                    live.update(display.build())
                     continue
 
                 # Redeem on Steam
                 display.set_current(name, "[dim]Redeeming on Steam…[/dim]")
-                live.update(display.build())
                 code = redeem_steam_key(session, key["redeemed_key_val"])
 
-                # Rate limit — wait 1 hour then retry
-                seconds = 0
+                # Rate limit — wait 1 hour then retry. Sleep in chunks against a
+                # monotonic deadline rather than waking every second.
                 wait_time = 3600
+                started = time.monotonic()
+                deadline = started + wait_time
+                if code == 53:
+                    # Don't hold finished rows in memory through an hour-long wait
+                    kfm.flush()
                 while code == 53:
-                    time.sleep(1)
-                    seconds += 1
-                    remaining = wait_time - (seconds % wait_time)
-                    rm, rs = divmod(remaining, 60)
-                    m, s = divmod(seconds, 60)
+                    now = time.monotonic()
+                    if now >= deadline:
+                        display.set_current(name, "[dim]Retrying…[/dim]")
+                        code = redeem_steam_key(session, key["redeemed_key_val"])
+                        deadline = time.monotonic() + wait_time
+                        continue
+                    rm, rs = divmod(int(deadline - now), 60)
+                    m, s = divmod(int(now - started), 60)
                     display.set_current(
                         name,
                         f"[bold yellow]Rate limited[/bold yellow] — retrying in {rm}m {rs}s [dim](waited {m}m {s}s)[/dim]",
                     )
-                    live.update(display.build())
-                    if seconds % wait_time == 0:
-                        display.set_current(name, "[dim]Retrying…[/dim]")
-                        live.update(display.build())
-                        code = redeem_steam_key(session, key["redeemed_key_val"])
+                    time.sleep(min(_RATE_LIMIT_TICK, max(0.1, deadline - now)))
 
                 # Tally result
                 if code == 0:
@@ -321,8 +362,8 @@ def redeem_steam_keys(
                     display.log(f"[red]✗[/red] {escape(name)} [dim]— {short}[/dim]")
 
                 kfm.write_key(code, key)
+                kfm.flush()
                 display.set_current(name)
-                live.update(display.build())
 
     # Final summary
     console.print()
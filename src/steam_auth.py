@@ -7,19 +7,24 @@ import io
 import secrets
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
 from urllib.parse import urlparse
 
 import requests
-from cryptography.hazmat.primitives.asymmetric.padding import PKCS1v15
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
+from requests.adapters import HTTPAdapter
+from requests.cookies import create_cookie
 from rich.prompt import Prompt
 from rich.text import Text
+from urllib3.util.retry import Retry
 
 from src import STEAM_COOKIE_FILE
 from src.utils import (
     STEAM_KEYS_PAGE,
     console,
     export_cookies,
+    loads_json,
     print_error,
     print_info,
     print_rule,
@@ -35,6 +40,14 @@ STEAM_LOGIN_URL = "https://login.steampowered.com"
 STEAM_USERDATA_API = "https://store.steampowered.com/dynamicstore/userdata/"
 STEAM_REDEEM_API = "https://store.steampowered.com/account/ajaxregisterkey/"
 
+# X-eresult header value Steam sends back for a wrong password
+_ERESULT_INVALID_PASSWORD = "5"
+
+# PollAuthSessionStatus cadence after credential login (seconds)
+_POLL_INITIAL_DELAY = 0.25
+_POLL_MAX_DELAY = 2.0
+_POLL_TIMEOUT = 60
+
 
 def _stdin_has_data() -> bool:
     """Check if stdin has data available without blocking."""
@@ -60,13 +73,39 @@ def _render_qr(url: str) -> str | None:
     return buf.getvalue()
 
 
+@lru_cache(maxsize=32)
+def _host(url: str) -> str | None:
+    """Hostname of *url* (transfer URLs repeat across login attempts)."""
+    return urlparse(url).hostname
+
+
+def _post_json(
+    session: requests.Session, url: str, data: dict[str, Any], timeout: float = 15
+) -> dict[str, Any]:
+    """POST form *data* to *url* and return the decoded JSON body."""
+    return loads_json(session.post(url, data=data, timeout=timeout).content)
+
+
+def _poll_auth_status(
+    session: requests.Session, client_id: str, request_id: str, timeout: float = 15
+) -> dict[str, Any]:
+    """One PollAuthSessionStatus round-trip. Returns its ``response`` object."""
+    return _post_json(
+        session,
+        f"{STEAM_API}/IAuthenticationService/PollAuthSessionStatus/v1",
+        {"client_id": client_id, "request_id": request_id},
+        timeout,
+    ).get("response", {})
+
+
 def _finalize_session(session: requests.Session, refresh_token: str) -> requests.Session:
     """Exchange a refresh token for full session cookies on Steam store/community."""
-    for init_url in [
-        "https://steamcommunity.com",
-        "https://store.steampowered.com",
-    ]:
-        session.get(init_url)
+    # Independent hosts — fetch both landing pages at once for their cookies
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(session.get, [
+            "https://steamcommunity.com",
+            "https://store.steampowered.com",
+        ]))
     session_id = session.cookies.get("sessionid", domain="steamcommunity.com")
     if not session_id:
         session_id = secrets.token_hex(12)
@@ -75,27 +114,32 @@ def _finalize_session(session: requests.Session, refresh_token: str) -> requests
         "help.steampowered.com",
         "steamcommunity.com",
     ]:
-        session.cookies.set("sessionid", session_id, domain=domain)
+        session.cookies.set_cookie(create_cookie("sessionid", session_id, domain=domain))
 
-    finalize_resp = session.post(
+    finalize_resp = _post_json(
+        session,
         f"{STEAM_LOGIN_URL}/jwt/finalizelogin",
-        data={
+        {
             "nonce": refresh_token,
             "sessionid": session_id,
             "redir": "https://store.steampowered.com/login/home/?goto=",
         },
-        timeout=15,
-    ).json()
+    )
 
     steam_id_str = finalize_resp.get("steamID", "")
 
-    # Try transfer URLs first
-    for transfer in finalize_resp.get("transfer_info", []):
-        url = transfer.get("url")
-        params = transfer.get("params", {})
-        params["steamID"] = steam_id_str
-        if url:
-            session.post(url, data=params, timeout=15)
+    # Try transfer URLs first — one per Steam domain, so post them all at once
+    transfers = [t for t in finalize_resp.get("transfer_info", []) if t.get("url")]
+    if transfers:
+        with ThreadPoolExecutor(max_workers=len(transfers)) as pool:
+            list(pool.map(
+                lambda t: session.post(
+                    t["url"],
+                    data={**t.get("params", {}), "steamID": steam_id_str},
+                    timeout=15,
+                ),
+                transfers,
+            ))
 
     # Check if store got authenticated via transfer URLs
     has_store_login = any(
@@ -112,7 +156,7 @@ def _finalize_session(session: requests.Session, refresh_token: str) -> requests
             auth_token = params.get("auth", "")
             if not auth_token:
                 continue
-            domain = urlparse(url).hostname
+            domain = _host(url)
             if domain:
                 cookie_value = f"{steam_id_str}%7C%7C{auth_token}"
                 session.cookies.set(
@@ -137,12 +181,11 @@ def _finalize_session(session: requests.Session, refresh_token: str) -> requests
 
 def _try_qr_login(session: requests.Session) -> requests.Session | None:
     """Attempt QR-code login via BeginAuthSessionViaQR. Returns session on success, None on skip/failure."""
-    begin_resp = session.post(
+    begin_data = _post_json(
+        session,
         f"{STEAM_API}/IAuthenticationService/BeginAuthSessionViaQR/v1",
-        data={"device_friendly_name": "eNkrypt Steam Redeemer"},
-        timeout=15,
-    )
-    begin_data = begin_resp.json().get("response", {})
+        {"device_friendly_name": "eNkrypt Steam Redeemer"},
+    ).get("response", {})
     challenge_url = begin_data.get("challenge_url")
     client_id = begin_data.get("client_id")
     request_id = begin_data.get("request_id")
@@ -171,15 +214,7 @@ def _try_qr_login(session: requests.Session) -> requests.Session | None:
                 sys.stdin.readline()  # consume the Enter
                 return None  # User wants manual login
 
-            poll_resp = (
-                session.post(
-                    f"{STEAM_API}/IAuthenticationService/PollAuthSessionStatus/v1",
-                    data={"client_id": client_id, "request_id": request_id},
-                    timeout=15,
-                )
-                .json()
-                .get("response", {})
-            )
+            poll_resp = _poll_auth_status(session, client_id, request_id)
 
             if "refresh_token" in poll_resp:
                 refresh_token = poll_resp["refresh_token"]
@@ -215,15 +250,7 @@ def _wait_for_code_or_approval(
                 return (line, None)
 
         try:
-            poll_resp = (
-                session.post(
-                    f"{STEAM_API}/IAuthenticationService/PollAuthSessionStatus/v1",
-                    data={"client_id": client_id, "request_id": request_id},
-                    timeout=5,
-                )
-                .json()
-                .get("response", {})
-            )
+            poll_resp = _poll_auth_status(session, client_id, request_id, timeout=5)
             if "refresh_token" in poll_resp:
                 console.print()  # finish the prompt line cleanly
                 print_success("Login approved via Steam app!")
@@ -239,26 +266,34 @@ def _wait_for_code_or_approval(
 
 def _credential_login(session: requests.Session) -> requests.Session:
     """Interactive username/password login with 2FA support."""
+    # Only needed here — keep the cryptography extension off the saved-cookie path
+    from cryptography.hazmat.primitives.asymmetric.padding import PKCS1v15
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
+
     s_username = Prompt.ask("[bold cyan]Username[/bold cyan]")
     s_password = Prompt.ask(
         f"[bold cyan]Password[/bold cyan] [dim]({s_username})[/dim]", password=True
     )
 
+    public_key = None
+    padding = PKCS1v15()
     while True:
-        # Step 1: Get RSA public key
-        rsa_resp = session.get(
-            f"{STEAM_API}/IAuthenticationService/GetPasswordRSAPublicKey/v1",
-            params={"account_name": s_username},
-            timeout=15,
-        ).json()["response"]
+        # Step 1: Get RSA public key (kept across wrong-password retries)
+        if public_key is None:
+            rsa_resp = loads_json(session.get(
+                f"{STEAM_API}/IAuthenticationService/GetPasswordRSAPublicKey/v1",
+                params={"account_name": s_username},
+                timeout=15,
+            ).content)["response"]
+
+            mod = int(rsa_resp["publickey_mod"], 16)
+            exp = int(rsa_resp["publickey_exp"], 16)
+            rsa_timestamp = rsa_resp["timestamp"]
 
-        mod = int(rsa_resp["publickey_mod"], 16)
-        exp = int(rsa_resp["publickey_exp"], 16)
-        rsa_timestamp = rsa_resp["timestamp"]
+            public_key = RSAPublicNumbers(e=exp, n=mod).public_key()
 
-        public_key = RSAPublicNumbers(e=exp, n=mod).public_key()
         encrypted_password = base64.b64encode(
-            public_key.encrypt(s_password.encode("utf-8"), PKCS1v15())
+            public_key.encrypt(s_password.encode("utf-8"), padding)
         ).decode("ascii")
 
         # Step 2: Begin auth session
@@ -273,9 +308,13 @@ def _credential_login(session: requests.Session) -> requests.Session:
             timeout=15,
         )
 
-        begin_data = begin_resp.json().get("response", {})
+        begin_data = loads_json(begin_resp.content).get("response", {})
         if "client_id" not in begin_data:
             print_error("Login failed — check your username and password.")
+            # A plain wrong password leaves the key valid; on anything else
+            # (e.g. an expired encryption timestamp) fetch a fresh one
+            if begin_resp.headers.get("x-eresult") != _ERESULT_INVALID_PASSWORD:
+                public_key = None
             s_password = Prompt.ask(
                 f"[bold cyan]Password[/bold cyan] [dim]({s_username})[/dim]",
                 password=True,
@@ -345,21 +384,20 @@ def _credential_login(session: requests.Session) -> requests.Session:
         with console.status(
             "Waiting for Steam authentication…", spinner="dots"
         ):
-            for _ in range(30):
-                poll_resp = (
-                    session.post(
-                        f"{STEAM_API}/IAuthenticationService/PollAuthSessionStatus/v1",
-                        data={"client_id": client_id, "request_id": request_id},
-                        timeout=15,
-                    )
-                    .json()
-                    .get("response", {})
-                )
+            # Poll quickly at first (a typed code is usually accepted at
+            # once), backing off to every 2s within the same 60s budget
+            delay = _POLL_INITIAL_DELAY
+            deadline = time.monotonic() + _POLL_TIMEOUT
+            while True:
+                poll_resp = _poll_auth_status(session, client_id, request_id)
 
                 if "refresh_token" in poll_resp:
                     refresh_token = poll_resp["refresh_token"]
                     break
-                time.sleep(2)
+                if time.monotonic() + delay > deadline:
+                    break
+                time.sleep(delay)
+                delay = min(delay * 1.5, _POLL_MAX_DELAY)
 
         if not refresh_token:
             print_error("Authentication timed out.")
@@ -368,10 +406,46 @@ def _credential_login(session: requests.Session) -> requests.Session:
         return _finalize_session(session, refresh_token)
 
 
-def steam_login(*, auto: bool = False) -> requests.Session:
-    """Sign into Steam web. Tries QR code first, falls back to credentials."""
+def _steam_adapter() -> HTTPAdapter:
+    """Adapter for Steam calls: keep-alive pool plus retries on gateway errors.
+
+    urllib3 only retries idempotent methods by default, so auth POSTs are
+    never replayed.
+    """
+    return HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+
+
+def _new_session(base_session: requests.Session | None) -> requests.Session:
+    """Create a Steam session, sharing *base_session*'s plain HTTP adapters if given.
+
+    Only the connection pools are shared — Steam keeps its own cookie jar.
+    Subclassed adapters (e.g. cloudscraper's CipherSuiteAdapter, with its
+    Cloudflare-tuned TLS context) are never lent to Steam; those prefixes and
+    Web API calls get their own retrying adapter.
+    """
+    session = requests.Session()
+    adapter = _steam_adapter()
+    for prefix in ("https://", "http://"):
+        shared = base_session.get_adapter(prefix) if base_session is not None else None
+        session.mount(prefix, shared if type(shared) is HTTPAdapter else adapter)
+    session.mount(f"{STEAM_API}/", _steam_adapter())
+    return session
+
+
+def steam_login(
+    *, auto: bool = False, base_session: requests.Session | None = None
+) -> requests.Session:
+    """Sign into Steam web. Tries QR code first, falls back to credentials.
+
+    Pass *base_session* (e.g. the Humble session) to reuse its plain ``HTTPAdapter``
+    connection pools.
+    """
     # Attempt to use saved session
-    r = requests.Session()
+    r = _new_session(base_session)
     if try_recover_cookies(STEAM_COOKIE_FILE, r) and verify_logins_session(r)[1]:
         return r
 
@@ -382,7 +456,7 @@ def steam_login(*, auto: bool = False) -> requests.Session:
     # Saved state doesn't work — interactive login
     print_rule("Steam Login")
 
-    session = requests.Session()
+    session = _new_session(base_session)
 
     # Try QR login first
     result = _try_qr_login(session)
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import json
 import os
 import pickle
+import re
 import sys
+import tempfile
+import time
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Generator, Union
+from typing import Any, Generator, Iterator, Union
 
+from requests.cookies import create_cookie
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
@@ -15,6 +22,13 @@ from rich.rule import Rule
 
 from src import APP_NAME, __version__
 
+# orjson is optional — ~3x faster on large Humble/Steam payloads when present
+try:
+    import orjson
+    loads_json = orjson.loads
+except ImportError:
+    loads_json = json.loads
+
 # Shared console instance — single source of truth for all output
 console = Console()
 
@@ -30,52 +44,128 @@ STEAM_KEYS_PAGE = "https://store.steampowered.com/account/registerkey"
 def find_dict_keys(
     node: Any, kv: str, parent: bool = False
 ) -> Generator[Any, None, None]:
-    """Recursively traverse nested dicts/lists yielding values (or parent dicts) for *kv*."""
-    if isinstance(node, list):
-        for item in node:
-            yield from find_dict_keys(item, kv, parent)
-    elif isinstance(node, dict):
-        if kv in node:
-            yield node if parent else node[kv]
-        for value in node.values():
-            yield from find_dict_keys(value, kv, parent)
+    """Traverse nested dicts/lists yielding values (or parent dicts) for *kv*, depth-first."""
+    # One generator frame with an explicit stack of iterators, instead of a
+    # nested generator per container; visit order matches the recursive walk
+    stack = [iter((node,))]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, dict):
+                if kv in item:
+                    yield item if parent else item[kv]
+                stack.append(iter(item.values()))
+                break
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
+        else:
+            stack.pop()
 
 
-def try_recover_cookies(cookie_file: Union[str, Path], session) -> bool:
-    """Load pickled cookies into *session*. Returns True on success."""
+def load_json_cache(path: Union[str, Path], max_age: float | None = None) -> Any:
+    """Load JSON from *path*. Returns None if missing, unreadable, or older than *max_age* seconds."""
     try:
-        with open(cookie_file, "rb") as f:
-            session.cookies.update(pickle.load(f))
+        if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, "rb") as f:
+            return loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def save_json_cache(path: Union[str, Path], data: Any) -> bool:
+    """Atomically write *data* as JSON to *path*. Returns True on success."""
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
         return True
-    except Exception:
+    except (OSError, TypeError, ValueError):
+        os.unlink(tmp)
         return False
 
 
-def export_cookies(cookie_file: Union[str, Path], session) -> bool:
-    """Persist *session* cookies to *cookie_file*. Returns True on success."""
+# Cookie attributes persisted to disk — enough to rebuild each one with
+# requests' create_cookie()
+_COOKIE_FIELDS = ("name", "value", "domain", "path", "expires", "secure")
+
+
+def try_recover_cookies(cookie_file: Union[str, Path], session) -> bool:
+    """Load saved cookies into *session*. Returns True on success."""
     try:
-        with open(cookie_file, "wb") as f:
-            pickle.dump(session.cookies, f)
+        with open(cookie_file, "rb") as f:
+            data = f.read()
+        # Cookie files written before the JSON format are pickled jars
+        if data.startswith(b"\x80"):
+            session.cookies.update(pickle.loads(data))
+        else:
+            for cookie in loads_json(data):
+                http_only = cookie.pop("http_only", False)
+                session.cookies.set_cookie(create_cookie(
+                    **cookie, rest={"HttpOnly": None} if http_only else {}
+                ))
+        _verify_cache.pop(session, None)
         return True
     except Exception:
         return False
 
 
+def export_cookies(cookie_file: Union[str, Path], session) -> bool:
+    """Persist *session* cookies to *cookie_file* as JSON. Returns True on success."""
+    # Saving cookies means the session was just (re)authenticated
+    _verify_cache.pop(session, None)
+    cookies = []
+    for c in session.cookies:
+        cookie = {field: getattr(c, field) for field in _COOKIE_FIELDS}
+        if c.has_nonstandard_attr("HttpOnly"):
+            cookie["http_only"] = True
+        cookies.append(cookie)
+    return save_json_cache(cookie_file, cookies)
+
+
+# Recent verify_logins_session results per live session object
+VERIFY_CACHE_TTL = 30
+_verify_cache: weakref.WeakKeyDictionary[Any, tuple[float, list[bool]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def verify_logins_session(session) -> list[bool]:
-    """Return ``[humble_logged_in, steam_logged_in]`` for *session*."""
+    """Return ``[humble_logged_in, steam_logged_in]`` for *session*.
+
+    Results are reused for ``VERIFY_CACHE_TTL`` seconds, until the session's
+    cookies are reloaded or exported.
+    """
+    cached = _verify_cache.get(session)
+    if cached is not None and time.monotonic() - cached[0] < VERIFY_CACHE_TTL:
+        return list(cached[1])
+
     results: list[bool] = []
     for url in [HUMBLE_KEYS_PAGE, STEAM_KEYS_PAGE]:
-        r = session.get(url, allow_redirects=False)
+        # HEAD is enough to see the login redirect; retry as GET if the server
+        # rejects it (405, or a Cloudflare challenge that only GET can solve)
+        r = session.head(url, allow_redirects=False)
+        if r.status_code >= 400:
+            r = session.get(url, allow_redirects=False)
         results.append(r.status_code not in (301, 302))
+    _verify_cache[session] = (time.monotonic(), list(results))
     return results
 
 
+# XXXXX-XXXXX-XXXXX, plus the longer 4- and 5-group product keys
+STEAM_KEY_RE = re.compile(r"[A-Z0-9]{5}(?:-[A-Z0-9]{5}){2,4}")
+_steam_key_fullmatch = STEAM_KEY_RE.fullmatch
+
+
 def valid_steam_key(key: str | None) -> bool:
-    """Check whether *key* looks like a Steam key (XXXXX-XXXXX-XXXXX)."""
-    if not isinstance(key, str):
-        return False
-    parts = key.split("-")
-    return len(key) == 17 and len(parts) == 3 and all(len(p) == 5 for p in parts)
+    """Check whether *key* looks like a Steam key: 3-5 dash-separated groups of 5 A-Z/0-9."""
+    return isinstance(key, str) and _steam_key_fullmatch(key) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -88,20 +178,21 @@ def cls() -> None:
     print_header()
 
 
+# Built once — cls() reprints it on every menu transition
+_HEADER_PANEL = Panel(
+    f"[bold cyan]-= {APP_NAME} =-[/bold cyan]\n"
+    f"[dim]v{__version__}[/dim]",
+    box=box.DOUBLE,
+    border_style="bright_blue",
+    expand=False,
+    padding=(1, 4),
+)
+
+
 def print_header() -> None:
     """Print the application header — double-line box, centered, with version."""
     console.print()
-    console.print(
-        Panel(
-            f"[bold cyan]-= {APP_NAME} =-[/bold cyan]\n"
-            f"[dim]v{__version__}[/dim]",
-            box=box.DOUBLE,
-            border_style="bright_blue",
-            expand=False,
-            padding=(1, 4),
-        ),
-        justify="center",
-    )
+    console.print(_HEADER_PANEL, justify="center")
     console.print()
 
 
@@ -146,34 +237,99 @@ _CYAN = "\033[36m"
 _GREEN = "\033[32m"
 _RST = "\033[0m"
 
+# Pre-composed redraw templates — only the label/question varies per frame
+_MENU_SELECTED = _CLR + _BOLD + _CYAN + "› {sc}  ·  {lbl}" + _RST + "\n"
+_MENU_UNSELECTED = _CLR + "  " + _DIM + "{sc}  ·  {lbl}" + _RST + "\n"
+_YN_YES = f"  {_BOLD}{_CYAN}‹ Yes ›{_RST} {_DIM}  No  {_RST}"
+_YN_NO = f"  {_DIM}  Yes  {_RST} {_BOLD}{_CYAN}‹ No  ›{_RST}"
+
 
-def _read_key() -> str:
-    """Read a single keypress. Returns 'up'/'down'/'left'/'right' for arrows."""
+# Prompt redraws go straight to the terminal fd on POSIX ttys, skipping
+# sys.stdout's text layer; redirected or Windows output keeps using it
+_TTY_FD = (
+    sys.stdout.fileno()
+    if sys.platform != "win32" and sys.stdout.isatty()
+    else None
+)
+
+
+def _write_out(text: str) -> None:
+    """Write *text* to the terminal immediately."""
+    if _TTY_FD is None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()  # keep ordering with anything already buffered
+    data = text.encode(sys.stdout.encoding or "utf-8", "replace")
+    while data:
+        data = data[os.write(_TTY_FD, data):]
+
+
+@contextmanager
+def _raw_mode() -> Iterator[None]:
+    """Hold the terminal in raw mode for a whole prompt (no-op on Windows).
+
+    Raw mode also disables output post-processing, so a bare ``\n`` no longer
+    returns the carriage — redraws must start lines with ``\r``.
+    """
     if sys.platform == "win32":
-        import msvcrt
-        ch = msvcrt.getwch()
-        if ch in ("\x00", "\xe0"):
-            ch2 = msvcrt.getwch()
-            return {"H": "up", "P": "down", "K": "left", "M": "right"}.get(ch2, "")
-        return ch
+        yield
+        return
     import termios
     import tty
     fd = sys.stdin.fileno()
     old = termios.tcgetattr(fd)
     try:
         tty.setraw(fd)
-        ch = sys.stdin.read(1)
-        if ch == "\x1b":
-            ch2 = sys.stdin.read(1)
-            if ch2 == "[":
-                ch3 = sys.stdin.read(1)
-                return {"A": "up", "B": "down", "C": "right", "D": "left"}.get(ch3, "")
-            return ""
-        return ch
+        yield
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old)
 
 
+def _getch(fd: int) -> str:
+    """Read one UTF-8 character straight from *fd*, bypassing sys.stdin's buffer."""
+    data = os.read(fd, 1)
+    if data and data[0] >= 0xC0:
+        # Lead byte of a multi-byte sequence — pull in its continuation bytes
+        data += os.read(fd, 1 if data[0] < 0xE0 else 2 if data[0] < 0xF0 else 3)
+    return data.decode("utf-8", errors="ignore")
+
+
+def _read_key(timeout: float | None = None) -> str:
+    """Read a single keypress. Returns 'up'/'down'/'left'/'right' for arrows.
+
+    With *timeout*, returns ``""`` if no key arrives in time so the caller can
+    redraw. On POSIX the caller must already be inside :func:`_raw_mode`.
+    """
+    if sys.platform == "win32":
+        import msvcrt
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            while not msvcrt.kbhit():
+                if time.monotonic() >= deadline:
+                    return ""
+                time.sleep(0.01)
+        ch = msvcrt.getwch()
+        if ch in ("\x00", "\xe0"):
+            ch2 = msvcrt.getwch()
+            return {"H": "up", "P": "down", "K": "left", "M": "right"}.get(ch2, "")
+        return ch
+    import select
+    # Read the fd directly: select() can't see bytes already sitting in
+    # sys.stdin's buffer, which would stall keys typed in quick succession
+    fd = sys.stdin.fileno()
+    if timeout is not None and not select.select([fd], [], [], timeout)[0]:
+        return ""
+    ch = _getch(fd)
+    if ch == "\x1b":
+        ch2 = _getch(fd)
+        if ch2 == "[":
+            ch3 = _getch(fd)
+            return {"A": "up", "B": "down", "C": "right", "D": "left"}.get(ch3, "")
+        return ""
+    return ch
+
+
 def prompt_menu(options: list[str], shortcuts: list[str] | None = None) -> int:
     """Vertical menu with arrow-key navigation and instant shortcut keys.
 
@@ -185,91 +341,94 @@ def prompt_menu(options: list[str], shortcuts: list[str] | None = None) -> int:
     selected = 0
 
     # Initial draw
-    for i in range(n):
-        _draw_menu_line(options[i], shortcuts[i], i == selected)
-
-    while True:
-        key = _read_key()
-        if key == "up" and selected > 0:
-            selected -= 1
-        elif key == "down" and selected < n - 1:
-            selected += 1
-        elif key in ("\r", "\n"):
-            sys.stdout.flush()
-            return selected
-        elif key == "\x03":
-            sys.stdout.flush()
-            raise KeyboardInterrupt
-        else:
-            # Instant shortcut key
-            for i, sc in enumerate(shortcuts):
-                if key.lower() == sc.lower():
-                    sys.stdout.flush()
-                    return i
-            continue
-
-        # Redraw in place
-        sys.stdout.write(f"\033[{n}A")
-        for i in range(n):
-            _draw_menu_line(options[i], shortcuts[i], i == selected)
-
-
-def _draw_menu_line(label: str, shortcut: str, selected: bool) -> None:
-    """Render a single menu line in place."""
-    sys.stdout.write(_CLR)
-    if selected:
-        sys.stdout.write(f"{_BOLD}{_CYAN}› {shortcut}  ·  {label}{_RST}\n")
-    else:
-        sys.stdout.write(f"  {_DIM}{shortcut}  ·  {label}{_RST}\n")
-    sys.stdout.flush()
+    _draw_menu(options, shortcuts, selected)
+
+    with _raw_mode():
+        while True:
+            key = _read_key()
+            if key == "up" and selected > 0:
+                selected -= 1
+            elif key == "down" and selected < n - 1:
+                selected += 1
+            elif key in ("\r", "\n"):
+                sys.stdout.flush()
+                return selected
+            elif key == "\x03":
+                sys.stdout.flush()
+                raise KeyboardInterrupt
+            else:
+                # Instant shortcut key
+                for i, sc in enumerate(shortcuts):
+                    if key.lower() == sc.lower():
+                        sys.stdout.flush()
+                        return i
+                continue
+
+            # Redraw in place, leaving the cursor at column 0 below the menu
+            _draw_menu(options, shortcuts, selected, f"\033[{n}A", "\r")
+
+
+def _draw_menu(
+    options: list[str],
+    shortcuts: list[str],
+    selected: int,
+    prefix: str = "",
+    suffix: str = "",
+) -> None:
+    """Render every menu line as one write and a single flush."""
+    _write_out(prefix + "".join(
+        _menu_line(label, shortcut, i == selected)
+        for i, (label, shortcut) in enumerate(zip(options, shortcuts))
+    ) + suffix)
+
+
+def _menu_line(label: str, shortcut: str, selected: bool) -> str:
+    """Return a single menu line, clearing whatever was drawn there."""
+    tmpl = _MENU_SELECTED if selected else _MENU_UNSELECTED
+    return tmpl.format(sc=shortcut, lbl=label)
 
 
 def prompt_yes_no(question: str, default: bool = True) -> bool:
     """Inline y/n toggle with arrow keys. Press y/n or arrows + Enter."""
     selected = default
+    interrupted = False
     _draw_yn(question, selected)
 
-    while True:
-        key = _read_key()
-        if key in ("left", "right", "up", "down"):
-            selected = not selected
-            _draw_yn(question, selected)
-        elif key in ("\r", "\n"):
-            sys.stdout.write("\n")
-            sys.stdout.flush()
-            return selected
-        elif key.lower() == "y":
-            sys.stdout.write("\n")
-            sys.stdout.flush()
-            return True
-        elif key.lower() == "n":
-            sys.stdout.write("\n")
-            sys.stdout.flush()
-            return False
-        elif key == "\x03":
-            sys.stdout.write("\n")
-            sys.stdout.flush()
-            raise KeyboardInterrupt
+    with _raw_mode():
+        while True:
+            key = _read_key()
+            if key in ("left", "right", "up", "down"):
+                selected = not selected
+                _draw_yn(question, selected)
+            elif key in ("\r", "\n"):
+                break
+            elif key.lower() == "y":
+                selected = True
+                break
+            elif key.lower() == "n":
+                selected = False
+                break
+            elif key == "\x03":
+                interrupted = True
+                break
+
+    # Back in cooked mode, so the newline also returns the carriage
+    _write_out("\n")
+    if interrupted:
+        raise KeyboardInterrupt
+    return selected
 
 
 def _draw_yn(question: str, selected: bool) -> None:
     """Render the inline yes/no toggle."""
-    sys.stdout.write(_CLR)
-    if selected:
-        yes = f"{_BOLD}{_CYAN}‹ Yes ›{_RST}"
-        no = f"{_DIM}  No  {_RST}"
-    else:
-        yes = f"{_DIM}  Yes  {_RST}"
-        no = f"{_BOLD}{_CYAN}‹ No  ›{_RST}"
-    sys.stdout.write(f"{question}  {yes} {no}")
-    sys.stdout.flush()
+    _write_out(_CLR + question + (_YN_YES if selected else _YN_NO))
 
 
 def write_skipped(skipped_games: dict[str, dict]) -> None:
     """Write skipped games to file and inform the user."""
     with open("skipped.txt", "w", encoding="utf-8-sig") as f:
-        for name in skipped_games:
-            f.write(name + "\n")
+        if skipped_games:
+            f.write("\n".join(skipped_games) + "\n")
 
     print_info(
         f"Skipped [bold]{len(skipped_games)}[/bold] games we think you already own."
@@ -18,8 +18,7 @@ a = Analysis(
         *cs_hiddenimports,
         *collect_submodules('cryptography'),
         *collect_submodules('cloudscraper'),
-        'fuzzywuzzy',
-        'Levenshtein',
+        'rapidfuzz',
         'requests_futures',
         'rich',
         'qrcode',
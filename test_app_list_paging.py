@@ -0,0 +1,85 @@
+"""Test windowed GetAppList paging against a mocked, unevenly dense catalog.
+
+Background: when the catalog ended inside a window, the final page was still
+clipped to that window's upper bound and the following window was cancelled,
+silently dropping every app above the bound — Steam's newest (densest) apps.
+"""
+
+import random
+
+import src.ownership as ownership
+
+PAGE_SIZE = 50000
+
+
+def make_catalog():
+    """Sparse low ids, a dense middle range, and a dense tail of new apps."""
+    rng = random.Random(42)
+    ids = set(rng.sample(range(10, 1_000_000), 40_000))
+    ids |= set(range(1_000_000, 1_200_000))
+    ids |= set(rng.sample(range(1_200_000, 1_990_000), 60_000))
+    ids |= set(range(1_990_000, 2_035_000))
+    return sorted(ids)
+
+
+def mock_pages(appids):
+    """Stand-in for _fetch_app_page serving *appids* like IStoreService/GetAppList."""
+    def fetch_page(api_key, last_appid=0):
+        page = [a for a in appids if a > last_appid][:PAGE_SIZE]
+        more = bool(page) and page[-1] != appids[-1]
+        data = {"apps": [{"appid": a, "name": f"App {a}"} for a in page]}
+        if more:
+            data["have_more_results"] = True
+            data["last_appid"] = page[-1]
+        return data
+    return fetch_page
+
+
+def fetch_with(appids):
+    original = ownership._fetch_app_page
+    ownership._fetch_app_page = mock_pages(appids)
+    try:
+        return [app["appid"] for app in ownership.fetch_app_list("key")]
+    finally:
+        ownership._fetch_app_page = original
+
+
+def test_uneven_density_fetches_every_app():
+    """Every appid comes back exactly once, in order."""
+    appids = make_catalog()
+    assert fetch_with(appids) == appids
+
+
+def test_catalog_ending_inside_early_window():
+    """The catalog ends in the first parallel window, with a dense tail past its bound."""
+    appids = list(range(1, PAGE_SIZE + 1)) + list(range(60_000, 100_100))
+    assert fetch_with(appids) == appids
+
+
+def test_single_page_catalog():
+    appids = list(range(1, 1000))
+    assert fetch_with(appids) == appids
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Test 1: Uneven appid density")
+    print("=" * 70)
+    test_uneven_density_fetches_every_app()
+
+    print()
+    print("=" * 70)
+    print("Test 2: Catalog ends inside an early window")
+    print("=" * 70)
+    test_catalog_ending_inside_early_window()
+
+    print()
+    print("=" * 70)
+    print("Test 3: Single-page catalog")
+    print("=" * 70)
+    test_single_page_catalog()
+
+    print()
+    print("=" * 70)
+    print("All tests passed! ✓")
+    print("=" * 70)
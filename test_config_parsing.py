@@ -0,0 +1,85 @@
+"""Test the PyYAML-less config.yaml fallback parser.
+
+Background: the line regex allowed any whitespace around the colon, newlines
+included — an empty value swallowed the following line as its value.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import src
+
+
+def parse_fallback(text):
+    """Parse *text* as config.yaml with PyYAML hidden."""
+    with tempfile.TemporaryDirectory() as tmp:
+        config_file = Path(tmp) / "config.yaml"
+        config_file.write_text(text)
+        original_file = src.CONFIG_FILE
+        original_yaml = sys.modules.get("yaml")
+        src.CONFIG_FILE = config_file
+        sys.modules["yaml"] = None  # makes "import yaml" raise ImportError
+        try:
+            return src._read_config()
+        finally:
+            src.CONFIG_FILE = original_file
+            if original_yaml is None:
+                del sys.modules["yaml"]
+            else:
+                sys.modules["yaml"] = original_yaml
+
+
+def test_empty_value_followed_by_key():
+    """An empty value stays empty and the next key is still parsed."""
+    config = parse_fallback("steam_api_key:\nhttp_concurrency: 4\n")
+    assert config == {"steam_api_key": "", "http_concurrency": 4}
+
+
+def test_values_and_comments():
+    config = parse_fallback(
+        "# settings\n"
+        "steam_api_key: ABC123\n"
+        "  trust_steam_app_ids :  true  \n"
+        "\n"
+        "http_concurrency: 6\n"
+    )
+    assert config == {
+        "steam_api_key": "ABC123",
+        "trust_steam_app_ids": True,
+        "http_concurrency": 6,
+    }
+
+
+def test_http_concurrency_values():
+    """Bad http_concurrency values fall back to the default instead of crashing."""
+    assert src._parse_concurrency(4) == 4
+    assert src._parse_concurrency("6") == 6
+    assert src._parse_concurrency(0) == 1
+    assert src._parse_concurrency(-3) == 1
+    assert src._parse_concurrency("4  # comment") == 8
+    assert src._parse_concurrency(None) == 8
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Test 1: Empty value followed by another key")
+    print("=" * 70)
+    test_empty_value_followed_by_key()
+
+    print()
+    print("=" * 70)
+    print("Test 2: Values and comments")
+    print("=" * 70)
+    test_values_and_comments()
+
+    print()
+    print("=" * 70)
+    print("Test 3: http_concurrency values")
+    print("=" * 70)
+    test_http_concurrency_values()
+
+    print()
+    print("=" * 70)
+    print("All tests passed! ✓")
+    print("=" * 70)
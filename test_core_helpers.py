@@ -0,0 +1,176 @@
+"""Test helpers that were rewritten for speed against their original behavior.
+
+Background: find_dict_keys went from a recursive generator to an explicit
+iterator stack, saved cookies went from a pickled jar to JSON, and
+match_ownership went from scoring every owned app with fuzzywuzzy to an
+indexed rapidfuzz lookup. Each must still give the results the original did.
+"""
+
+import pickle
+import random
+import tempfile
+from pathlib import Path
+
+import requests
+
+from src.ownership import OwnedAppIndex, match_ownership
+from src.utils import export_cookies, find_dict_keys, try_recover_cookies
+
+
+def reference_find_dict_keys(node, kv, parent=False):
+    """The original recursive walk."""
+    if isinstance(node, list):
+        for i in node:
+            yield from reference_find_dict_keys(i, kv, parent)
+    elif isinstance(node, dict):
+        if kv in node:
+            yield node if parent else node[kv]
+        for j in node.values():
+            yield from reference_find_dict_keys(j, kv, parent)
+
+
+def random_tree(rng, depth=0):
+    """Build a random mix of nested dicts, lists and scalars."""
+    if depth > 4 or rng.random() < 0.2:
+        return rng.choice([1, "x", None, [], {}])
+    if rng.random() < 0.5:
+        return [random_tree(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    keys = rng.sample(["steam_app_id", "human_name", "tpkd_dict", "a", "b"], rng.randint(0, 4))
+    return {key: random_tree(rng, depth + 1) for key in keys}
+
+
+def test_find_dict_keys_matches_recursive_walk():
+    """Same values, same order, and the very same objects as the recursive walk."""
+    rng = random.Random(0)
+    for _ in range(500):
+        tree = random_tree(rng)
+        for parent in (False, True):
+            expected = list(reference_find_dict_keys(tree, "steam_app_id", parent))
+            actual = list(find_dict_keys(tree, "steam_app_id", parent))
+            assert len(actual) == len(expected)
+            assert all(a is e for a, e in zip(actual, expected))
+
+
+def round_trip(session):
+    """Export *session* cookies and load them into a fresh session."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cookie_file = Path(tmp) / "cookies.json"
+        assert export_cookies(cookie_file, session)
+        restored = requests.Session()
+        assert try_recover_cookies(cookie_file, restored)
+        return restored
+
+
+def cookie_attrs(session):
+    return sorted(
+        (c.name, c.value, c.domain, c.path, c.expires, c.secure, c.has_nonstandard_attr("HttpOnly"))
+        for c in session.cookies
+    )
+
+
+def test_cookie_json_round_trip():
+    """JSON cookies keep name, domain, path, expiry, Secure and HttpOnly."""
+    session = requests.Session()
+    session.cookies.set(
+        "steamLoginSecure", "abc", domain="store.steampowered.com",
+        path="/", expires=2_000_000_000, secure=True,
+    )
+    session.cookies.set(
+        "sessionid", "def", domain="steamcommunity.com",
+        path="/market", expires=None, secure=False, rest={},
+    )
+    restored = round_trip(session)
+    assert cookie_attrs(restored) == cookie_attrs(session)
+    assert cookie_attrs(restored)[0][-1] is False  # sessionid is not HttpOnly
+    assert cookie_attrs(restored)[1][-1] is True  # steamLoginSecure is
+
+
+def test_legacy_pickle_cookies_load():
+    """Cookie files pickled by older versions still load."""
+    session = requests.Session()
+    session.cookies.set("_simpleauth_sess", "xyz", domain=".humblebundle.com", secure=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        cookie_file = Path(tmp) / "cookies.pkl"
+        cookie_file.write_bytes(pickle.dumps(session.cookies))
+        restored = requests.Session()
+        assert try_recover_cookies(cookie_file, restored)
+    assert cookie_attrs(restored) == cookie_attrs(session)
+
+
+OWNED = {
+    10: "Portal 2",
+    20: "City Lost",
+    30: "Space 3",
+    40: "The Witcher® 3: Wild Hunt",
+    50: "Hollow Knight",
+    60: "DOOM Eternal",
+}
+
+
+def test_match_ownership_like_baseline():
+    """Results agree with the original fuzzywuzzy scan over every owned app."""
+    owned = OwnedAppIndex(OWNED)
+    cases = {
+        # exact and case/punctuation differences
+        "Portal 2": (100, 10),
+        "portal 2": (100, 10),
+        "The Witcher 3: Wild Hunt": (100, 40),
+        # trademark symbols
+        "Portal 2™": (100, 10),
+        "Hollow Knight™": (100, 50),
+        # near misses, including ones sharing no whole token
+        "CityLost": (94, 20),
+        "Portal": (86, 10),
+        "Space 4": (86, 30),
+        # unrelated titles
+        "Doom": (0, None),
+        "Space3": (0, None),
+        "Stardew Valley": (0, None),
+        "Hollow Knight: Silksong": (0, None),
+    }
+    for title, expected in cases.items():
+        assert match_ownership(owned, {"human_name": title}) == expected, title
+
+
+def test_match_ownership_normalization():
+    """Spelled-out trademarks are stripped, and blank titles never match."""
+    owned = OwnedAppIndex(OWNED)
+    assert match_ownership(owned, {"human_name": "Portal 2 (TM)"}) == (100, 10)
+    assert match_ownership(owned, {"human_name": "™"}) == (0, None)
+    assert match_ownership(OwnedAppIndex({1: "???"}), {"human_name": "™"}) == (0, None)
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Test 1: find_dict_keys matches the recursive walk")
+    print("=" * 70)
+    test_find_dict_keys_matches_recursive_walk()
+
+    print()
+    print("=" * 70)
+    print("Test 2: Cookie JSON round trip")
+    print("=" * 70)
+    test_cookie_json_round_trip()
+
+    print()
+    print("=" * 70)
+    print("Test 3: Legacy pickled cookies")
+    print("=" * 70)
+    test_legacy_pickle_cookies_load()
+
+    print()
+    print("=" * 70)
+    print("Test 4: match_ownership agrees with the baseline")
+    print("=" * 70)
+    test_match_ownership_like_baseline()
+
+    print()
+    print("=" * 70)
+    print("Test 5: match_ownership normalization")
+    print("=" * 70)
+    test_match_ownership_normalization()
+
+    print()
+    print("=" * 70)
+    print("All tests passed! ✓")
+    print("=" * 70)